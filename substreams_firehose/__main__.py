@@ -12,11 +12,25 @@ import json
 import logging
 import os
 from argparse import ArgumentError, ArgumentTypeError
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pprint import pformat
 
+from google.protobuf.internal import api_implementation
 from hjson import HjsonDecodeError
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to the stdlib `json` encoder if the optional `orjson` dependency is not installed
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    # Fallback to the default `asyncio` event loop if the optional `uvloop` dependency is not installed
+    uvloop = None
+
 from substreams_firehose.args import check_period, parse_arguments
 from substreams_firehose.block_extractors.common import process_blocks
 from substreams_firehose.config.parser import Config, StubConfig
@@ -49,7 +63,9 @@ def main() -> int: #pylint: disable=too-many-statements, too-many-branches, too-
 
     logging.basicConfig(
         handlers=logging_handlers,
-        level=logging.DEBUG,
+        # Only enable debug records when a log file collects them: the per-block debug statements are
+        # not free and the console handler would filter them out anyway
+        level=logging.DEBUG if len(logging_handlers) > 1 else CONSOLE_HANDLER.level,
         format='%(asctime)s:T+%(relativeCreated)d %(levelname)s %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S',
         force=True
@@ -63,6 +79,16 @@ def main() -> int: #pylint: disable=too-many-statements, too-many-branches, too-
 
     logging.debug('Script arguments: %s', args)
 
+    # === Protobuf backend check ===
+
+    protobuf_backend = api_implementation.Type()
+    if protobuf_backend == 'python':
+        logging.warning('Google protobuf is using the pure-Python backend: block parsing will be significantly slower. '
+            'Install the C++/upb backend or unset the "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION" environment variable.'
+        )
+    else:
+        logging.debug('Google protobuf backend: %s', protobuf_backend)
+
     # === Config loading ===
 
     try:
@@ -105,6 +131,14 @@ def main() -> int: #pylint: disable=too-many-statements, too-many-branches, too-
     if args.out_file != 'jsonl/{chain}_{start}_to_{end}.jsonl':
         out_file = args.out_file
 
+    # Resolve the output folder *before* streaming any block so an invalid path fails right away
+    # instead of after the whole extraction
+    try:
+        os.makedirs(os.path.dirname(out_file), exist_ok=True)
+    except FileNotFoundError:
+        # File is not found if is not inside a folder and doesn't exists yet
+        pass
+
     try:
         block_extractor = getattr(
             importlib.import_module(
@@ -135,6 +169,10 @@ def main() -> int: #pylint: disable=too-many-statements, too-many-branches, too-
 
     # === Main methods calls ===
 
+    if uvloop:
+        uvloop.install()
+        logging.debug('Using "uvloop" event loop implementation')
+
     data = process_blocks(
         asyncio.run(
             block_extractor(
@@ -148,24 +186,32 @@ def main() -> int: #pylint: disable=too-many-statements, too-many-branches, too-
 
     # === Output data to file ===
 
+    rows_written = 0
     try:
-        os.makedirs(os.path.dirname(out_file), exist_ok=True)
-    except FileNotFoundError:
-        # File is not found if is not inside a folder and doesn't exists yet
-        pass
-
-    try:
-        with open(out_file, 'w', encoding='utf8') as out:
+        with open(out_file, 'wb') as out:
+            # Serialize rows as they are parsed, flushing by large batches to overlap block processing with disk writes
+            buffer = bytearray()
             for entry in data:
                 if args.no_json_output:
-                    out.write(entry)
+                    buffer += str(entry).encode('utf8')
+                elif orjson:
+                    # Block processors may yield dataclass instances (cheaper than dicts), serialized natively by orjson
+                    buffer += orjson.dumps(entry, option=orjson.OPT_SERIALIZE_DATACLASS) # TODO: Add exception handling
                 else:
-                    json.dump(entry, out) # TODO: Add exception handling
-                out.write('\n')
+                    buffer += json.dumps(asdict(entry) if is_dataclass(entry) else entry).encode('utf8')
+                buffer += b'\n'
+                rows_written += 1
+
+                # Flush the output by batches of 1MiB
+                if len(buffer) >= 1 << 20:
+                    out.write(buffer)
+                    buffer.clear()
+
+            out.write(buffer)
     except OSError as error:
         logging.error('Could not write out file to "%s": %s', out_file, error)
 
-    logging.info('Wrote %i rows of data to %s [SUCCESS]', len(data), out_file)
+    logging.info('Wrote %i rows of data to %s [SUCCESS]', rows_written, out_file)
     return 0
 
 if __name__ == '__main__':
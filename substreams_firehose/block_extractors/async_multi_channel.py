@@ -14,7 +14,7 @@ Diagram: see ['asynchronous_dream_block_streaming.jpg'](../../block_extractors_e
 """
 
 import asyncio
-from itertools import zip_longest
+from itertools import chain, zip_longest
 import logging
 import statistics
 import time
@@ -54,12 +54,17 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
         A list of raw blocks (`google.protobuf.any_pb2.Any` objects) that can later be processed.
     """
     async def _spawner(token):
-        data = []
+        # Collect each task's result as its own chunk and flatten once at the end,
+        # avoiding repeated extensions of an ever-growing list
+        data_chunks = []
         async with get_secure_channel() as secure_channel:
             async def _task_spawner():
+                # Snapshotted once: the task name never changes and the polling loop logs it on every iteration
+                task_name = get_current_task_name()
+
                 while True:
                     logging.debug('[%s] %i tasks running | polling every %fs | %i blocks remaining in block_pool["%s"]',
-                        get_current_task_name(),
+                        task_name,
                         len(running),
                         spawn_frequency,
                         len(block_pool[token])*workload,
@@ -69,7 +74,7 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
                     try:
                         await asyncio.sleep(spawn_frequency)
                     except asyncio.CancelledError:
-                        logging.warning('[%s] Stopping spawner task NOW...', get_current_task_name())
+                        logging.warning('[%s] Stopping spawner task NOW...', task_name)
                         return
 
                     if (max_tasks and len(running) >= max_tasks) or not token in block_pool:
@@ -77,7 +82,7 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
 
                     if not block_pool[token]:
                         logging.warning('[%s] No more blocks in block_pool["%s"], stopping spawner task NOW...',
-                            get_current_task_name(),
+                            task_name,
                             token
                         )
                         return
@@ -128,7 +133,7 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
                             spawn_frequency = statistics.mean(tasks_runtime)
                             task_start_time = None
 
-                    data += task.result()
+                    data_chunks.append(task.result())
                 elif not spawner_task.done():
                     if not max_tasks or len(running) < max_tasks:
                         logging.warning('[%s] Maximum number of tasks reached: %i tasks before exception %s',
@@ -147,7 +152,7 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
                         block_pool[token].add((task_exception.failed, task_exception.end))
 
         logging.info('[%s] Block streaming done !', get_current_task_name())
-        return data
+        return list(chain.from_iterable(data_chunks))
 
     def reshape_block_pool(split): # TODO: Reshape according to number of workers by spawner (+ runtime)
         unified_block_pool = set.union(*block_pool.values())
@@ -197,4 +202,4 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
             block_pool = reshape_block_pool(len(spawners))
             previous_pending = len(spawners)
 
-    return [item for l in [spawner.result() for spawner in done] for item in l]
+    return list(chain.from_iterable(spawner.result() for spawner in done))
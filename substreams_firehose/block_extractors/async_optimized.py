@@ -6,14 +6,16 @@ coming from the parsing of the raw data. This allows for an increased throughput
 the gRPC stream.
 
 It uses asynchronous directives to divide the work into a *fixed* amount of workers defined by the `initial_tasks`
-argument. If a task fails, it waits for all the other tasks to finish before restarting the failed task again for
-the missing blocks.
+argument. Workers pull block ranges from a shared queue until it is empty, so fast workers pick up the remaining work
+instead of idling behind a static partition. If a task fails, the missing blocks are put back into the queue to be
+retried by the next available worker.
 
 Diagram: see ['asynchronous_optimized_block_streaming.jpg'](../../block_extractors_explained/asynchronous_optimized_block_streaming.jpg).
 """
 
 import asyncio
 import logging
+from itertools import chain
 
 from google.protobuf.message import Message
 
@@ -22,30 +24,74 @@ from substreams_firehose.block_extractors.common import stream_blocks
 from substreams_firehose.config.parser import Config
 from substreams_firehose.exceptions import BlockStreamException
 
-async def asyncio_main(period_start: int, period_end: int, initial_tasks: int = 25, **kwargs) -> list[Message]:
+async def asyncio_main(period_start: int, period_end: int, initial_tasks: int = 25, workload: int = 100, **kwargs) -> list[Message]:
     """
     Extract blocks from a gRPC channel as raw blocks for later processing.
 
     Using asynchronous directives, a *fixed* amount of workers will be initially spawned to \
     extract data from the gRPC channel until all blocks have been retrieved. \
+    Workers dynamically pull their block ranges from a shared pool, so the work doesn't need to be split equally upfront. \
     The returned list can then be parsed for extracting relevant data from the blocks.
 
     Args:
         period_start: The first block number of the targeted period.
         period_end: The last block number of the targeted period.
-        initial_tasks: The initial number of concurrent tasks to start for streaming blocks.
+        initial_tasks: The number of concurrent tasks to start for streaming blocks.
+        workload: The maximum number of blocks to extract for each unit of work.
         kwargs: Additional keyword arguments to pass to the gRPC request (must match `.proto` file definition).
 
     Returns:
         A list of raw blocks (`google.protobuf.any_pb2.Any` objects) that can later be processed.
     """
-    block_diff = period_end - period_start
-    split = block_diff//initial_tasks
+    async def _worker():
+        """
+        Pull block ranges from the shared pool until it is empty, streaming each range and saving the results.
+
+        Failed ranges are put back into the pool (starting from the failed block) until the maximum number of \
+        retries is reached.
+        """
+        while True:
+            try:
+                chunk_start, chunk_end = block_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                data_chunks.append(await stream_blocks(chunk_start, chunk_end, secure_channel, **kwargs))
+            except BlockStreamException as error:
+                failed_counter[error.failed] = failed_counter.get(error.failed, 0) + 1
+                if failed_counter[error.failed] <= Config.MAX_FAILED_BLOCK_RETRIES:
+                    logging.warning('Could not fetch block #%i: retrying... (%i/%i retries)',
+                        error.failed,
+                        failed_counter[error.failed],
+                        Config.MAX_FAILED_BLOCK_RETRIES
+                    )
+
+                    block_pool.put_nowait((error.failed, error.end))
+                else:
+                    logging.error('Could not fetch block #%i: maximum number of retries reached (%i)',
+                        error.failed,
+                        Config.MAX_FAILED_BLOCK_RETRIES
+                    )
 
-    # Prevent having more tasks than the amount of blocks to process
-    if block_diff <= initial_tasks:
-        split = block_diff
+    block_diff = period_end - period_start
+    # Run only one task if number of blocks to stream is very small
+    if block_diff < initial_tasks:
         initial_tasks = 1
+        workload = max(block_diff, 1)
+    # Adjust workload to give work to all the tasks in case the number of blocks to stream is too small
+    elif block_diff < initial_tasks * workload:
+        workload = block_diff//initial_tasks
+
+    # Split the period range into workload-sized ranges for the workers to pull from
+    block_pool = asyncio.Queue()
+    for chunk_start in range(period_start, period_end + 1, workload):
+        block_pool.put_nowait((chunk_start, min(chunk_start + workload - 1, period_end)))
+
+    # Collect each task's result as its own chunk and flatten once at the end,
+    # avoiding repeated extensions of an ever-growing list
+    data_chunks = []
+    failed_counter = {}
 
     logging.info('Streaming %i blocks on %s chain (running %i workers)...',
         period_end - period_start + 1,
@@ -53,50 +99,12 @@ async def asyncio_main(period_start: int, period_end: int, initial_tasks: int =
         initial_tasks
     )
 
-    tasks = set()
-    data = []
-    failed_counter = {}
     async with get_secure_channel() as secure_channel:
-        for i in range(initial_tasks):
-            tasks.add(
-                asyncio.create_task(
-                    stream_blocks(
-                        period_start + i*split,
-                        # Gives the remaining blocks to the last task in case the work can't be splitted equally
-                        period_start + (i+1)*split - 1 if i < initial_tasks-1 else period_end,
-                        secure_channel,
-                        **kwargs
-                    )
-                )
-            )
-
-        failed_tasks = tasks.copy()
-        while failed_tasks:
-            failed_tasks.clear()
-            for task in tasks:
-                try:
-                    data += await task
-                except BlockStreamException as error:
-                    failed_counter[error.failed] = failed_counter.get(error.failed, 0) + 1
-                    if failed_counter[error.failed] <= Config.MAX_FAILED_BLOCK_RETRIES:
-                        logging.warning('Could not fetch block #%i: retrying... (%i/%i retries)',
-                            error.failed,
-                            failed_counter[error.failed],
-                            Config.MAX_FAILED_BLOCK_RETRIES
-                        )
-
-                        failed_tasks.add(
-                            asyncio.create_task(
-                                stream_blocks(error.failed, error.end, secure_channel, **kwargs)
-                            )
-                        )
-                    else:
-                        logging.error('Could not fetch block #%i: maximum number of retries reached (%i)',
-                            error.failed,
-                            Config.MAX_FAILED_BLOCK_RETRIES
-                        )
-
-            tasks = failed_tasks.copy()
+        # Fan the workers back in as each one finishes rather than in spawn order, so results
+        # (and worker failures) surface as soon as they happen
+        for worker in asyncio.as_completed([asyncio.create_task(_worker()) for _ in range(initial_tasks)]):
+            await worker
+            logging.debug('Worker finished, %i block ranges left in pool', block_pool.qsize())
 
     logging.info('Block streaming done !')
-    return data
+    return list(chain.from_iterable(data_chunks))
@@ -16,6 +16,7 @@ import asyncio
 import logging
 import statistics
 import time
+from itertools import chain
 
 from google.protobuf.message import Message
 
@@ -64,9 +65,12 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
             tasks_running.remove(task)
             tasks_done.put_nowait(task)
 
+        # Snapshotted once: the task name never changes and the polling loop logs it on every iteration
+        task_name = get_current_task_name()
+
         while True:
             logging.debug('[%s] %i tasks running | polling every %fs | %i blocks remaining in block pool',
-                get_current_task_name(),
+                task_name,
                 len(tasks_running),
                 spawn_frequency,
                 len(block_pool) * workload,
@@ -75,12 +79,12 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
             try:
                 await asyncio.sleep(spawn_frequency)
             except asyncio.CancelledError:
-                logging.warning('[%s] Cancelled, stopping spawner task NOW...', get_current_task_name())
+                logging.warning('[%s] Cancelled, stopping spawner task NOW...', task_name)
                 return
 
             if not block_pool:
                 logging.warning('[%s] No more blocks in block pool, stopping spawner task NOW...',
-                    get_current_task_name(),
+                    task_name,
                 )
                 return
 
@@ -113,7 +117,9 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
 
     # Split the period range into smaller ranges according to the workload given to each task
     block_pool = {(k, k + workload - 1) for k in range(period_start, period_end, workload)}
-    raw_data = []
+    # Collect each task's result as its own chunk and flatten once at the end,
+    # avoiding repeated extensions of an ever-growing list
+    raw_data_chunks = []
 
     # Track the tasks' runtime history for auto-adjusting the task spawning frequency (if enabled)
     tasks_runtime_history = []
@@ -143,7 +149,7 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
                         spawn_frequency = statistics.mean(tasks_runtime_history)
                         task_start_time = None
 
-                raw_data += task.result()
+                raw_data_chunks.append(task.result())
             elif not spawner_task.done():
                 if not max_tasks or len(tasks_running) < max_tasks:
                     logging.warning('[%s] Maximum number of tasks reached: %i tasks before exception %s',
@@ -157,6 +163,7 @@ async def asyncio_main(period_start: int, period_end: int, #pylint: disable=too-
                     # Add non-extracted blocks back to the block pool
                     block_pool.add((task_exception.failed, task_exception.end))
 
+    raw_data = list(chain.from_iterable(raw_data_chunks))
     logging.info('Finished block streaming, got %i blocks [SUCCESS]',
         len(raw_data),
     )
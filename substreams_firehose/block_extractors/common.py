@@ -5,8 +5,12 @@ Holds common functions used by the block extractors.
 """
 
 import logging
+import multiprocessing
+import os
 from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
+from itertools import repeat
 
 import grpc
 from google.protobuf.json_format import ParseDict
@@ -38,32 +42,135 @@ async def get_secure_channel() -> Generator[grpc.aio.Channel, None, None]:
         options=[
             ('grpc.max_receive_message_length', Config.MAX_BLOCK_SIZE),
             ('grpc.max_send_message_length', Config.MAX_BLOCK_SIZE),
+            # Raise the concurrent streams limit above HTTP/2's default of 100 so spawning more workers
+            # on the channel doesn't silently queue them behind the cap
+            ('grpc.max_concurrent_streams', 1000),
+            ('grpc.http2.max_pings_without_data', 0),
+            # Long-running streams tuning: give each stream a receive window large enough for a full block
+            # and keep the connection alive (detecting silent drops) while blocks are being processed
+            ('grpc.http2.lookahead_bytes', Config.MAX_BLOCK_SIZE),
+            ('grpc.keepalive_time_ms', 30000),
+            ('grpc.keepalive_timeout_ms', 10000),
+            ('grpc.keepalive_permit_without_calls', 1),
         ],
         compression=Config.COMPRESSION
     )
 
-def process_blocks(raw_blocks: Sequence[Message], block_processor: Callable[[Message], dict]) -> list[dict]:
+def _get_request_template(**kwargs) -> Message:
     """
-    Parse data using the given block processor, feeding it previously extracted raw blocks from a gRPC stream.
+    Build (and cache) a request message holding the static parameters shared by every `stream_blocks` task.
+
+    The stub config parameters (filter expressions, fork steps, modules, etc.) and CLI keyword arguments are \
+    identical for all the tasks of a run: parsing them once into a template avoids re-merging the dicts and \
+    re-running `ParseDict` for each spawned task.
 
     Args:
-        raw_blocks: A sequence of packed blocks (`google.protobuf.any_pb2.Any` objects) extracted from a gRPC stream.
+        kwargs: Additional keyword arguments overriding the stub config request parameters.
+
+    Returns:
+        A `StubConfig.REQUEST_OBJECT` message with every parameter set except the block range.
+    """
+    # Save the parsed templates as function attribute, keyed by the overriding keyword arguments
+    if not hasattr(_get_request_template, 'saved_templates'):
+        _get_request_template.saved_templates = {}
+
+    template_key = (StubConfig.REQUEST_OBJECT, tuple(sorted(kwargs.items())))
+    if template_key not in _get_request_template.saved_templates:
+        request_parameters = {**StubConfig.REQUEST_PARAMETERS, **kwargs}
+        _get_request_template.saved_templates[template_key] = ParseDict(request_parameters, StubConfig.REQUEST_OBJECT())
+
+    return _get_request_template.saved_templates[template_key]
+
+def _get_service_method(secure_channel: grpc.aio.Channel) -> Callable:
+    """
+    Instantiate (and cache) the gRPC service stub for the given channel and resolve the streaming method on it.
+
+    Building a stub compiles one callable per service method: sharing it between all the tasks running on the \
+    same channel avoids redoing that work for every spawned task.
+
+    Args:
+        secure_channel: The gRPC secure channel (SSL/TLS) the service stub is bound to.
+
+    Returns:
+        The bound gRPC method used for streaming blocks.
+
+    Raises:
+        AttributeError: If the stub config method cannot be found on the service object.
+    """
+    # Save the resolved methods as function attribute, keyed by the channel and targeted service method
+    if not hasattr(_get_service_method, 'saved_methods'):
+        _get_service_method.saved_methods = {}
+
+    method_key = (secure_channel, StubConfig.SERVICE_OBJECT, StubConfig.SERVICE_METHOD_FUNCTION)
+    if method_key not in _get_service_method.saved_methods:
+        stub = StubConfig.SERVICE_OBJECT(secure_channel)
+        try:
+            _get_service_method.saved_methods[method_key] = getattr(stub, StubConfig.SERVICE_METHOD_FUNCTION)
+        except AttributeError:
+            logging.exception('Could not find method "%s" for request object "%s"',
+                StubConfig.SERVICE_METHOD_FUNCTION,
+                stub
+            )
+            raise
+
+    return _get_service_method.saved_methods[method_key]
+
+def _process_chunk(raw_blocks: Sequence[Message], block_processor: Callable[[Message], dict]) -> list[dict]:
+    """
+    Run the block processor over a chunk of raw blocks, returning the parsed rows.
+
+    Unit of work dispatched to the worker processes spawned by `process_blocks`.
+
+    Args:
+        raw_blocks: A chunk of packed blocks (`google.protobuf.any_pb2.Any` objects) extracted from a gRPC stream.
         block_processor: A generator function extracting relevant data from a block.
 
     Returns:
         A list of parsed data in the format returned by the block processor.
     """
-    data = []
-    for raw_block in raw_blocks:
-        for blob in block_processor(raw_block):
-            data.append(blob)
+    return [blob for raw_block in raw_blocks for blob in block_processor(raw_block)]
+
+def process_blocks(raw_blocks: Sequence[Message], block_processor: Callable[[Message], dict]) -> Generator[dict, None, None]:
+    """
+    Parse data using the given block processor, feeding it previously extracted raw blocks from a gRPC stream.
 
-    logging.info('Finished block processing, parsed %i rows of data [SUCCESS]', len(data))
+    The work is spread over all available cores (block parsing being CPU-bound) when the platform supports \
+    forking worker processes, falling back to in-process parsing otherwise.
 
-    return data
+    Acts as a generator to allow parsed data to be consumed (e.g. serialized and written to disk) as it is produced, \
+    without holding the full result set in memory.
+
+    Args:
+        raw_blocks: A sequence of packed blocks (`google.protobuf.any_pb2.Any` objects) extracted from a gRPC stream.
+        block_processor: A generator function extracting relevant data from a block.
+
+    Yields:
+        Parsed data in the format returned by the block processor.
+    """
+    total_rows = 0
+    workers = os.cpu_count() or 1
+
+    # Block parsing is CPU-bound (protobuf decoding and JSON conversion) so spread the chunks over all cores.
+    # Worker processes must inherit the loaded main and stub configs for the block processors to work, which is
+    # only guaranteed with the 'fork' start method: fall back to in-process parsing otherwise (or for small workloads).
+    if workers > 1 and len(raw_blocks) > workers and multiprocessing.get_start_method() == 'fork':
+        chunk_size = -(-len(raw_blocks)//workers) # Ceiling division
+        chunks = [raw_blocks[i:i + chunk_size] for i in range(0, len(raw_blocks), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rows in executor.map(_process_chunk, chunks, repeat(block_processor)):
+                total_rows += len(rows)
+                yield from rows
+    else:
+        for raw_block in raw_blocks:
+            for blob in block_processor(raw_block):
+                total_rows += 1
+                yield blob
+
+    logging.info('Finished block processing, parsed %i rows of data [SUCCESS]', total_rows)
 
 async def stream_blocks(start: int, end: int, secure_channel: grpc.aio.Channel,
-                        block_processor: Callable[[Message], dict] = lambda block: [block], **kwargs) -> list[Message | dict]:
+                        block_processor: Callable[[Message], dict] | None = None, **kwargs) -> list[Message | dict]:
     """
     Return raw blocks (or parsed data) for the subset period between `start` and `end`.
 
@@ -84,65 +191,78 @@ async def stream_blocks(start: int, end: int, secure_channel: grpc.aio.Channel,
     """
     data = []
     current_block_number = start
+    # Computed once per task: the task name never changes and `asyncio.current_task()` lookups add up in the streaming loop
+    task_name = get_current_task_name()
+    # Hoisted as well so the per-block debug statement is skipped without even creating a log record
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-    stub = StubConfig.SERVICE_OBJECT(secure_channel)
-    try:
-        service_method = getattr(stub, StubConfig.SERVICE_METHOD_FUNCTION)
-    except AttributeError:
-        logging.exception('Could not find method "%s" for request object "%s"',
-            StubConfig.SERVICE_METHOD_FUNCTION,
-            stub
-        )
-        raise
+    # Hoisted out of the streaming loop: raw extraction (no block processor) appends the response directly
+    # instead of going through a list-wrapping call for every block
+    if block_processor:
+        # Bind the extend method once so the closure doesn't redo the attribute lookup for every block
+        extend_data = data.extend
+        def _store_block(block: Message) -> None:
+            extend_data([b for b in block_processor(block) if b])
+    else:
+        _store_block = data.append
+
+    service_method = _get_service_method(secure_channel)
 
-    # Move request parameters to dict to allow CLI keyword arguments to override the stub config
-    request_parameters = {
-        'start_block_num': start,
-        'stop_block_num': end + (1 if StubConfig.SUBSTREAMS_PACKAGE_OBJECT else 0),
-        **StubConfig.REQUEST_PARAMETERS,
-        **kwargs
-    }
-    req = ParseDict(request_parameters, StubConfig.REQUEST_OBJECT())
+    # Copy the precomputed template (stub config parameters overridden by CLI keyword arguments)
+    # and only fill in the block range for this task
+    req = StubConfig.REQUEST_OBJECT()
+    req.CopyFrom(_get_request_template(**kwargs))
+    req.start_block_num = start
+    req.stop_block_num = end + (1 if StubConfig.SUBSTREAMS_PACKAGE_OBJECT else 0)
 
     logging.debug('[%s] Starting streaming blocks from #%i to #%i...',
-        get_current_task_name(),
+        task_name,
         start,
         end,
     )
 
+    # Resolved from the first response: the response message type is fixed for the whole stream so the field holding
+    # the payload only needs to be looked up once, instead of probing every response with exception handling
+    response_has_block = response_has_data = None
+
     try:
         async for response in service_method(req):
+            if response_has_block is None:
+                response_fields = type(response).DESCRIPTOR.fields_by_name
+                response_has_block = 'block' in response_fields
+                response_has_data = 'data' in response_fields
+
             response_data = None
-            try:
+            if response_has_block:
                 response_data = response.block
-            except AttributeError:
-                try:
-                    if response.data.outputs:
-                        response_data = response.data
-                except AttributeError:
-                    logging.warning('[%s] No valid output message found in response : %s',
-                        get_current_task_name(),
-                        response
-                    )
+            elif response_has_data:
+                if response.data.outputs:
+                    response_data = response.data
+            else:
+                logging.warning('[%s] No valid output message found in response : %s',
+                    task_name,
+                    response
+                )
 
             if response_data:
-                logging.debug('[%s] Getting block number #%i (%i blocks remaining)...',
-                    get_current_task_name(),
-                    current_block_number,
-                    end - current_block_number
-                )
+                if debug_enabled:
+                    logging.debug('[%s] Getting block number #%i (%i blocks remaining)...',
+                        task_name,
+                        current_block_number,
+                        end - current_block_number
+                    )
                 current_block_number += 1
 
-                data.extend([b for b in block_processor(response_data) if b])
+                _store_block(response_data)
 
     except grpc.aio.AioRpcError as error:
         logging.error('[%s] Failed to process block number #%i: %s',
-            get_current_task_name(),
+            task_name,
             current_block_number,
             error
         )
 
         raise BlockStreamException(start, end, current_block_number) from error
 
-    logging.debug('[%s] Done !\n', get_current_task_name())
+    logging.debug('[%s] Done !\n', task_name)
     return data
@@ -2,6 +2,10 @@
 SPDX-License-Identifier: MIT
 
 Provides block processors to parse information from the extracted blocks of a gRPC stream.
+
+Block processors are generator functions yielding one row of parsed data per output record. Rows can be plain
+dictionaries (like the processors below) or `dataclass` instances (with optional `__slots__` for cheaper attribute
+storage on large extractions): both are serialized transparently by the JSONL output writer.
 """
 
 import json
@@ -103,8 +103,9 @@ def load_config(file: str, grpc_entry_id: str | None = None) -> bool:
         else:
             logging.exception('Unrecognized compression option: "%s" not one of "gzip" or "deflate"', compression_option)
             raise ArgumentTypeError
-    except KeyError as error:
-        Config.COMPRESSION = Compression.NoCompression
+    except KeyError:
+        # Default to gzip: block payloads are large and highly compressible, making uncompressed streams network-bound
+        Config.COMPRESSION = Compression.Gzip
 
     Config.PROTO_MESSAGES_CLASSES = generate_proto_messages_classes()
 
@@ -28,11 +28,15 @@ def get_auth_token(use_cache: bool = True) -> str:
     Raises:
         RuntimeError: If the JWT token could not be acquired from the endpoint.
     """
-    session = CachedSession(
-        'jwt_token',
-        expire_after=timedelta(days=1), # Cache JWT token (for up to 24 hours)
-        allowable_methods=['GET', 'POST'],
-    )
+    # Lazily instantiate a single shared session: creating a `CachedSession` sets up the cache backend,
+    # which doesn't need to be redone for every token lookup (one per channel opened)
+    if not hasattr(get_auth_token, 'session'):
+        get_auth_token.session = CachedSession(
+            'jwt_token',
+            expire_after=timedelta(days=1), # Cache JWT token (for up to 24 hours)
+            allowable_methods=['GET', 'POST'],
+        )
+    session = get_auth_token.session
 
     headers = {'Content-Type': 'application/json',}
     data = f'{{"api_key":"{Config.API_KEY}"}}'
@@ -43,8 +47,9 @@ def get_auth_token(use_cache: bool = True) -> str:
         response = session.post(Config.AUTH_ENDPOINT, headers=headers, data=data, timeout=10) # TODO: Make timeout part of main config
 
     if response.status_code == 200:
-        logging.debug('JWT response: %s', response.json())
-        jwt = response.json()['token']
+        response_json = response.json()
+        logging.debug('JWT response: %s', response_json)
+        jwt = response_json['token']
         logging.info('Got JWT token (%s) [SUCCESS]', "cached" if response.from_cache else "new")
     else:
         logging.error('Could not load JWT token: %s', response.text)
@@ -200,21 +200,31 @@ def import_all_from_module(module_name: str) -> list[ModuleType]:
     """
     Dynamically import all python files located in the specified module's folder.
 
+    Called repeatedly for the same packages when loading the proto descriptor set at startup, so the results are \
+    cached to only pay the filesystem listing and `inspect` lookup once per module.
+
     Args:
         module_name: The name of the module to import files from.
 
     Returns:
         The list of imported modules.
     """
-    module = importlib.import_module(module_name)
-    module_path = inspect.getattr_static(module, '__path__')[0]
+    # Save the imported modules as function attribute, keyed by the module name
+    if not hasattr(import_all_from_module, 'saved_imports'):
+        import_all_from_module.saved_imports = {}
+
+    if module_name not in import_all_from_module.saved_imports:
+        module = importlib.import_module(module_name)
+        module_path = inspect.getattr_static(module, '__path__')[0]
+
+        imported = []
+        for file in os.listdir(module_path):
+            if file.endswith(".py"):
+                imported.append(importlib.import_module(f'{module_name}.{file.rsplit(".", 1)[0]}'))
 
-    imported = []
-    for file in os.listdir(module_path):
-        if file.endswith(".py"):
-            imported.append(importlib.import_module(f'{module_name}.{file.rsplit(".", 1)[0]}'))
+        import_all_from_module.saved_imports[module_name] = imported
 
-    return imported
+    return import_all_from_module.saved_imports[module_name]
 
 def open_file_from_package(path: str, mode: str = 'r') -> BinaryIO | TextIO:
     """